@@ -2,18 +2,29 @@ from asyncio import CancelledError
 from concurrent.futures import Executor
 from sqlite3 import Connection, OperationalError
 from threading import Lock
-from typing import Iterable, Iterator, Optional, Tuple
+from typing import Iterable, Iterator, MutableSequence, Optional, Tuple
 
 from std2.asyncio import run_in_executor
 from std2.sqlite3 import with_transaction
 
 from ...shared.executor import SingleThreadExecutor
 from ...shared.settings import MatchOptions
-from ...shared.sql import BIGGEST_INT, init_db, like_esc
+from ...shared.sql import BIGGEST_INT, ascii_lower, glob_esc, init_db
 from ...shared.timeit import timeit
 from .sql import sql
 
 
+def globs(word: str, sym: str) -> Tuple[str, str]:
+    """
+    An empty side is already ruled out by its `<> ''` guard,
+    reuse the other side's pattern so both stay index range scans
+    """
+
+    glob_word = glob_esc(ascii_lower(word or sym))
+    glob_sym = glob_esc(ascii_lower(sym or word))
+    return glob_word, glob_sym
+
+
 def _init() -> Connection:
     conn = Connection(":memory:", isolation_level=None)
     init_db(conn)
@@ -24,26 +35,28 @@ def _init() -> Connection:
 
 class Database:
     def __init__(self, pool: Executor) -> None:
+        # Held by writes and `_interrupt`, so interrupts only ever abort reads
         self._lock = Lock()
         self._ex = SingleThreadExecutor(pool)
         self._conn: Connection = self._ex.submit(_init)
+        self._pending: MutableSequence[Tuple[str]] = []
 
     def _interrupt(self) -> None:
         with self._lock:
             self._conn.interrupt()
 
     async def insert(self, words: Iterable[str]) -> None:
-        def cont() -> None:
-            with self._lock, with_transaction(self._conn.cursor()) as cursor:
-                cursor.executemany(
-                    sql("insert", "word"), ({"word": word} for word in words)
-                )
+        """
+        Buffered until the next `select`, which is the only reader
+        """
 
-        await run_in_executor(self._ex.submit, cont)
+        self._pending.extend((word,) for word in words)
 
     async def select(
         self, clear: bool, opts: MatchOptions, word: str, sym: str, limitless: int
     ) -> Iterator[Tuple[str, Optional[str]]]:
+        pending, self._pending = self._pending, []
+
         def cont() -> Iterator[Tuple[str, Optional[str]]]:
             if clear:
                 with self._lock, with_transaction(self._conn.cursor()) as cursor:
@@ -51,8 +64,37 @@ class Database:
                     return iter(())
             else:
                 try:
-                    with with_transaction(self._conn.cursor()) as cursor:
-                        limit = BIGGEST_INT if limitless else opts.max_results
+                    if pending:
+                        with self._lock, with_transaction(
+                            self._conn.cursor()
+                        ) as cursor:
+                            cursor.executemany(sql("insert", "word"), pending)
+
+                    if not word and not sym:
+                        return iter(())
+
+                    cursor = self._conn.cursor()
+                    limit = BIGGEST_INT if limitless else opts.max_results
+                    if (
+                        len(word) <= opts.exact_matches
+                        and len(sym) <= opts.exact_matches
+                    ):
+                        # The whole input is the exact prefix, fuzzy matching is moot
+                        glob_word, glob_sym = globs(word, sym=sym)
+                        cursor.execute(
+                            sql("select", "prefix_words"),
+                            {
+                                "limit": limit,
+                                "word": word,
+                                "sym": sym,
+                                "glob_word": glob_word,
+                                "glob_sym": glob_sym,
+                            },
+                        )
+                    else:
+                        glob_word, glob_sym = globs(
+                            word[: opts.exact_matches], sym=sym[: opts.exact_matches]
+                        )
                         cursor.execute(
                             sql("select", "words"),
                             {
@@ -62,26 +104,25 @@ class Database:
                                 "limit": limit,
                                 "word": word,
                                 "sym": sym,
-                                "like_word": like_esc(word[: opts.exact_matches]),
-                                "like_sym": like_esc(sym[: opts.exact_matches]),
+                                "glob_word": glob_word,
+                                "glob_sym": glob_sym,
+                            },
+                        )
+                    words = [(row["word"], None) for row in cursor]
+                    if words:
+                        return iter(words)
+                    else:
+                        cursor.execute(
+                            sql("select", "backup_words"),
+                            {
+                                "exact": opts.exact_matches,
+                                "cut_off": opts.fuzzy_cutoff,
+                                "look_ahead": opts.look_ahead,
+                                "limit": limit,
+                                "word": word,
                             },
                         )
-                        rows = cursor.fetchall()
-                        if rows:
-                            return ((row["word"], None) for row in rows)
-                        else:
-                            cursor.execute(
-                                sql("select", "backup_words"),
-                                {
-                                    "exact": opts.exact_matches,
-                                    "cut_off": opts.fuzzy_cutoff,
-                                    "look_ahead": opts.look_ahead,
-                                    "limit": limit,
-                                    "word": word,
-                                },
-                            )
-                            rows = cursor.fetchall()
-                            return ((row["word"], row["sort_by"]) for row in rows)
+                        return iter([(row["word"], row["sort_by"]) for row in cursor])
                 except OperationalError:
                     return iter(())
 
@@ -1,3 +1,2 @@
-INSERT OR REPLACE INTO words (word,  lword)
-VALUES                       (:word, LOWER(:word))
-
+INSERT OR REPLACE INTO words (word, lword)
+VALUES                       (?1,   LOWER(?1))
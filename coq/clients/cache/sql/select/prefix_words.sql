@@ -0,0 +1,24 @@
+SELECT
+  word
+FROM words
+WHERE
+  word <> ''
+  AND
+  (
+    (
+      :word <> ''
+      AND
+      lword GLOB :glob_word
+      AND
+      word <> :word
+    )
+    OR
+    (
+      :sym <> ''
+      AND
+      lword GLOB :glob_sym
+      AND
+      word <> :sym
+    )
+  )
+LIMIT :limit
@@ -8,7 +8,7 @@ WHERE
     (
       :word <> ''
       AND 
-      lword LIKE :like_word ESCAPE '!'
+      lword GLOB :glob_word
       AND 
       LENGTH(word) + :look_ahead >= LENGTH(:word)
       AND
@@ -20,7 +20,7 @@ WHERE
     (
       :sym <> ''
       AND 
-      lword LIKE :like_sym ESCAPE '!'
+      lword GLOB :glob_sym
       AND 
       LENGTH(word) + :look_ahead >= LENGTH(:sym)
       AND
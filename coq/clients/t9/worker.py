@@ -1,5 +1,4 @@
 from asyncio import LimitOverrunError, create_subprocess_exec, shield, sleep
-from asyncio.locks import Lock
 from asyncio.subprocess import Process
 from contextlib import suppress
 from itertools import chain
@@ -8,45 +7,55 @@ from json.decoder import JSONDecodeError
 from os import X_OK, access
 from pathlib import PurePath
 from subprocess import DEVNULL, PIPE
-from typing import Any, AsyncIterator, Iterator, Mapping, Optional, Sequence
+from typing import AsyncIterator, Iterator, Mapping, Optional, Sequence
 
-from pynvim_pp.lib import awrite, decode, encode, go
+from pynvim_pp.lib import awrite, go
 from pynvim_pp.logging import log
-from std2.pickle import DecodeError, new_decoder, new_encoder
+from std2.pickle import DecodeError, new_decoder
 
 from ...lang import LANG
 from ...lsp.protocol import PROTOCOL
 from ...shared.runtime import Supervisor
 from ...shared.runtime import Worker as BaseWorker
 from ...shared.settings import BaseClient, MatchOptions
-from ...shared.types import Completion, Context, ContextualEdit
+from ...shared.types import UTF8, Completion, Context, ContextualEdit
 from .install import ensure_updated, t9_bin
-from .types import ReqL1, ReqL2, Request, RespL1, Response
+from .types import RespL1, Response
 
 _VERSION = "3.2.28"
 
 _DECODER = new_decoder[RespL1](RespL1, strict=False)
-_ENCODER = new_encoder[Request](Request)
 
+# Fixed request shape, only the fields are serialized per keystroke
+_REQUEST = (
+    '{"version":'
+    + dumps(_VERSION)
+    + ',"request":{"Autocomplete":{"filename":%s,"before":%s,"after":%s,'
+    + '"region_includes_beginning":%s,"region_includes_end":%s,'
+    + '"max_num_results":%s}}}'
+)
 
-def _encode(options: MatchOptions, context: Context, limit: int) -> Any:
+# Replies are one JSON document per line, size the read buffer for the largest
+_LIMIT = 2 ** 20
+
+
+def _encode(options: MatchOptions, context: Context, limit: int) -> bytes:
     row, _ = context.position
     before = context.linefeed.join(chain(context.lines_before, (context.line_before,)))
     after = context.linefeed.join(chain((context.line_after,), context.lines_after))
     ibg = row - options.proximate_lines <= 0
     ieof = row + options.proximate_lines >= context.line_count
-
-    l2 = ReqL2(
-        filename=context.filename,
-        before=before,
-        after=after,
-        region_includes_beginning=ibg,
-        region_includes_end=ieof,
-        max_num_results=None if context.manual else limit,
+    max_num_results = None if context.manual else limit
+
+    json = _REQUEST % (
+        dumps(context.filename, ensure_ascii=False),
+        dumps(before, ensure_ascii=False),
+        dumps(after, ensure_ascii=False),
+        dumps(ibg),
+        dumps(ieof),
+        dumps(max_num_results),
     )
-    l1 = ReqL1(Autocomplete=l2)
-    req = Request(request=l1, version=_VERSION)
-    return _ENCODER(req)
+    return json.encode(UTF8, "surrogateescape")
 
 
 def _decode(client: BaseClient, reply: Response) -> Iterator[Completion]:
@@ -57,27 +66,29 @@ def _decode(client: BaseClient, reply: Response) -> Iterator[Completion]:
     ):
         log.warn("%s", reply)
     else:
+        short_name, weight_adjust = client.short_name, client.weight_adjust
         for result in results:
             try:
                 resp = _DECODER(result)
             except DecodeError as e:
                 log.warn("%s", e)
             else:
+                new_text = resp.new_prefix + resp.new_suffix
                 edit = ContextualEdit(
                     old_prefix=old_prefix,
                     new_prefix=resp.new_prefix,
                     old_suffix=resp.old_suffix,
-                    new_text=resp.new_prefix + resp.new_suffix,
+                    new_text=new_text,
                 )
                 label_pre, *_ = resp.new_prefix.splitlines() or ("",)
                 *_, label_post = resp.new_suffix.splitlines() or ("",)
                 label = label_pre + label_post
                 kind = PROTOCOL.CompletionItemKind.get(resp.kind)
                 cmp = Completion(
-                    source=client.short_name,
-                    weight_adjust=client.weight_adjust,
+                    source=short_name,
+                    weight_adjust=weight_adjust,
                     label=label,
-                    sort_by=edit.new_text,
+                    sort_by=new_text,
                     primary_edit=edit,
                     kind=kind or "",
                     icon_match=kind,
@@ -93,6 +104,7 @@ async def _proc(bin: PurePath, cwd: PurePath) -> Optional[Process]:
             stdout=PIPE,
             stderr=DEVNULL,
             cwd=cwd,
+            limit=_LIMIT,
         )
     except FileNotFoundError:
         return None
@@ -102,7 +114,7 @@ async def _proc(bin: PurePath, cwd: PurePath) -> Optional[Process]:
 
 class Worker(BaseWorker[BaseClient, None]):
     def __init__(self, supervisor: Supervisor, options: BaseClient, misc: None) -> None:
-        self._lock = Lock()
+        self._inflight = False
         self._bin: Optional[PurePath] = None
         self._proc: Optional[Process] = None
         self._cwd: Optional[PurePath] = None
@@ -150,9 +162,9 @@ class Worker(BaseWorker[BaseClient, None]):
                 proc.kill()
             await proc.wait()
 
-    async def _comm(self, cwd: PurePath, json: str) -> Optional[str]:
-        async def cont() -> Optional[str]:
-            async with self._lock:
+    async def _comm(self, cwd: PurePath, json: bytes) -> Optional[bytes]:
+        async def cont() -> Optional[bytes]:
+            try:
                 if self._bin and not self._proc:
                     self._proc = await _proc(self._bin, cwd=cwd)
                     if self._proc:
@@ -162,36 +174,39 @@ class Worker(BaseWorker[BaseClient, None]):
                 else:
                     assert self._proc.stdin and self._proc.stdout
                     try:
-                        self._proc.stdin.write(encode(json))
+                        self._proc.stdin.write(json)
                         self._proc.stdin.write(b"\n")
                         await self._proc.stdin.drain()
                         out = await self._proc.stdout.readline()
                     except (ConnectionError, LimitOverrunError, ValueError):
                         return await self._clean()
                     else:
-                        return decode(out)
+                        return out
+            finally:
+                self._inflight = False
 
-        if self._lock.locked():
+        if self._inflight:
             return None
         else:
+            self._inflight = True
             return await shield(cont())
 
     async def work(self, context: Context) -> AsyncIterator[Completion]:
         if self._cwd != context.cwd:
             await self._clean()
 
-        if self._bin:
-            req = _encode(
+        # Only one request in flight, don't build one that would be dropped
+        if self._bin and not self._inflight:
+            json = _encode(
                 self._supervisor.match,
                 context=context,
                 limit=self._supervisor.match.max_results,
             )
-            json = dumps(req, check_circular=False, ensure_ascii=False)
             reply = await self._comm(context.cwd, json=json)
             if reply:
                 try:
                     resp = loads(reply)
-                except JSONDecodeError as e:
+                except (JSONDecodeError, UnicodeDecodeError) as e:
                     log.warn("%s", e)
                 else:
                     for comp in _decode(self._options, reply=resp):
@@ -3,6 +3,7 @@ from json import dumps
 from os.path import normcase
 from pathlib import Path
 from sqlite3.dbapi2 import Connection
+from string import ascii_lowercase, ascii_uppercase
 from typing import (
     AbstractSet,
     Any,
@@ -24,6 +25,8 @@ from .fuzzy import quick_ratio
 
 BIGGEST_INT = 2 ** 63 - 1
 
+_ASCII_LOWER = str.maketrans(ascii_uppercase, ascii_lowercase)
+
 
 class _Loader(Protocol):
     def __call__(self, *paths: AnyPath) -> str:
@@ -45,6 +48,20 @@ def like_esc(like: str) -> str:
     return f"{escaped}%"
 
 
+def ascii_lower(text: str) -> str:
+    """
+    Same folding as sqlite's `LOWER()`, which only touches ASCII
+    """
+
+    return text.translate(_ASCII_LOWER)
+
+
+@lru_cache
+def glob_esc(glob: str) -> str:
+    escaped = "".join(f"[{char}]" if char in {"*", "?", "["} else char for char in glob)
+    return f"{escaped}*"
+
+
 class _Quantiles:
     def __init__(self) -> None:
         self._qs: MutableSet[float] = set()
@@ -0,0 +1,97 @@
+from random import Random, randrange
+from sqlite3 import Connection
+from typing import AbstractSet
+from unittest import TestCase
+
+from ....coq.clients.cache.database import globs
+from ....coq.clients.cache.sql import sql
+from ....coq.shared.sql import BIGGEST_INT, init_db, like_esc
+
+_CHARS = "aAbBzZ_%*?[]éÉ"
+_EXACT = 2
+_LIKE = """
+SELECT word
+FROM words
+WHERE lword LIKE :like ESCAPE '!'
+"""
+_GLOB = """
+SELECT word
+FROM words
+WHERE lword GLOB :glob
+"""
+
+
+def _word(rand: Random, lo: int, hi: int) -> str:
+    return "".join(rand.choice(_CHARS) for _ in range(rand.randint(lo, hi)))
+
+
+def _init(rand: Random) -> Connection:
+    conn = Connection(":memory:", isolation_level=None)
+    init_db(conn)
+    conn.executescript(sql("create", "pragma"))
+    conn.executescript(sql("create", "tables"))
+    words = {_word(rand, lo=0, hi=8) for _ in range(3000)}
+    conn.executemany(sql("insert", "word"), ((word,) for word in words))
+    return conn
+
+
+def _select(conn: Connection, stmt: str, **params: object) -> AbstractSet[str]:
+    return {word for word, *_ in conn.execute(stmt, params)}
+
+
+class Globs(TestCase):
+    def test_1(self) -> None:
+        glob_word, glob_sym = globs("Ab", sym="")
+        self.assertEqual((glob_word, glob_sym), ("ab*", "ab*"))
+
+    def test_2(self) -> None:
+        glob_word, glob_sym = globs("", sym="É*")
+        self.assertEqual((glob_word, glob_sym), ("É[*]*", "É[*]*"))
+
+    def test_3(self) -> None:
+        seed = randrange(2 ** 32)
+        rand = Random(seed)
+        conn = _init(rand)
+
+        for _ in range(500):
+            prefix = _word(rand, lo=0, hi=3)
+            glob, _ = globs(prefix, sym=prefix)
+            lhs = _select(conn, _LIKE, like=like_esc(prefix))
+            rhs = _select(conn, _GLOB, glob=glob)
+            self.assertEqual(lhs, rhs, (seed, prefix))
+
+
+class PrefixWords(TestCase):
+    def test_1(self) -> None:
+        seed = randrange(2 ** 32)
+        rand = Random(seed)
+        conn = _init(rand)
+
+        for _ in range(500):
+            word, sym = _word(rand, lo=0, hi=_EXACT), _word(rand, lo=0, hi=_EXACT)
+            if not word and not sym:
+                continue
+
+            glob_word, glob_sym = globs(word[:_EXACT], sym=sym[:_EXACT])
+            lhs = _select(
+                conn,
+                sql("select", "words"),
+                exact=_EXACT,
+                cut_off=0.6,
+                look_ahead=2,
+                limit=BIGGEST_INT,
+                word=word,
+                sym=sym,
+                glob_word=glob_word,
+                glob_sym=glob_sym,
+            )
+            rhs = _select(
+                conn,
+                sql("select", "prefix_words"),
+                limit=BIGGEST_INT,
+                word=word,
+                sym=sym,
+                glob_word=glob_word,
+                glob_sym=glob_sym,
+            )
+            self.assertEqual(lhs, rhs, (seed, word, sym))
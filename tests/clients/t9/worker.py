@@ -0,0 +1,83 @@
+from json import loads
+from pathlib import PurePath
+from unittest import TestCase
+from uuid import uuid4
+
+from ....coq.clients.t9.worker import _encode
+from ....coq.shared.settings import MatchOptions
+from ....coq.shared.types import UTF8, Context
+
+_OPTIONS = MatchOptions(
+    unifying_chars={"_", "-"},
+    max_results=33,
+    proximate_lines=16,
+    look_ahead=2,
+    exact_matches=2,
+    fuzzy_cutoff=0.6,
+)
+
+
+def _context(filename: str, line: str) -> Context:
+    lines_before, lines_after = ("abc", line), (line, "xyz")
+    return Context(
+        manual=False,
+        change_id=uuid4(),
+        commit_id=uuid4(),
+        cwd=PurePath(),
+        buf_id=1,
+        filetype="",
+        filename=filename,
+        line_count=100,
+        linefeed="\n",
+        tabstop=2,
+        expandtab=True,
+        comment=("", ""),
+        position=(50, 2),
+        scr_col=2,
+        line="ab",
+        line_before="a",
+        line_after="b",
+        lines=(*lines_before, "ab", *lines_after),
+        lines_before=lines_before,
+        lines_after=lines_after,
+        words="ab",
+        words_before="a",
+        words_after="b",
+        syms="ab",
+        syms_before="a",
+        syms_after="b",
+        ws_before="",
+        ws_after="",
+    )
+
+
+class Encode(TestCase):
+    def test_1(self) -> None:
+        context = _context('a"b.py', line="é")
+        json = _encode(_OPTIONS, context=context, limit=_OPTIONS.max_results)
+        req = loads(json)
+        self.assertEqual(
+            req,
+            {
+                "version": "3.2.28",
+                "request": {
+                    "Autocomplete": {
+                        "filename": 'a"b.py',
+                        "before": "abc\né\na",
+                        "after": "b\né\nxyz",
+                        "region_includes_beginning": False,
+                        "region_includes_end": False,
+                        "max_num_results": 33,
+                    }
+                },
+            },
+        )
+
+    def test_2(self) -> None:
+        context = _context("\udcff.py", line="\udcff")
+        json = _encode(_OPTIONS, context=context, limit=_OPTIONS.max_results)
+        req = loads(json.decode(UTF8, "surrogateescape"))
+        l2 = req["request"]["Autocomplete"]
+        self.assertEqual(l2["filename"], "\udcff.py")
+        self.assertEqual(l2["before"], "abc\n\udcff\na")
+        self.assertEqual(l2["after"], "b\n\udcff\nxyz")
@@ -0,0 +1,50 @@
+from sqlite3 import Connection
+from unittest import TestCase
+
+from ...coq.shared.sql import ascii_lower, glob_esc
+
+
+class GlobEsc(TestCase):
+    def test_1(self) -> None:
+        glob = glob_esc("")
+        self.assertEqual(glob, "*")
+
+    def test_2(self) -> None:
+        glob = glob_esc("abc")
+        self.assertEqual(glob, "abc*")
+
+    def test_3(self) -> None:
+        glob = glob_esc("a*b?c")
+        self.assertEqual(glob, "a[*]b[?]c*")
+
+    def test_4(self) -> None:
+        glob = glob_esc("a[b]c")
+        self.assertEqual(glob, "a[[]b]c*")
+
+    def test_5(self) -> None:
+        conn = Connection(":memory:")
+        for text in ("*", "?", "[", "]", "[]", "a[*]b", "%_"):
+            (matched,) = conn.execute(
+                "SELECT ? GLOB ?", (f"{text}tail", glob_esc(text))
+            ).fetchone()
+            self.assertTrue(matched, text)
+            (matched,) = conn.execute(
+                "SELECT ? GLOB ?", (f"x{text}", glob_esc(text))
+            ).fetchone()
+            self.assertFalse(matched, text)
+
+
+class AsciiLower(TestCase):
+    def test_1(self) -> None:
+        lower = ascii_lower("AbC_1")
+        self.assertEqual(lower, "abc_1")
+
+    def test_2(self) -> None:
+        lower = ascii_lower("ÉÄ")
+        self.assertEqual(lower, "ÉÄ")
+
+    def test_3(self) -> None:
+        conn = Connection(":memory:")
+        for text in ("", "AbC", "ÉtÉ", "ΑΒΓ", "ǅ", "İ"):
+            (lower,) = conn.execute("SELECT LOWER(?)", (text,)).fetchone()
+            self.assertEqual(ascii_lower(text), lower)